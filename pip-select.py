@@ -6,7 +6,8 @@ Interactive multi-select upgrader for pip-installed packages (excluding conda-in
 
 Features:
   1) Detect packages installed via pip (excludes conda-installed packages)
-  2) Lists outdated packages directly via pip (no external dependencies)
+  2) Checks for outdated packages via concurrent PyPI queries, falling back
+     to pip when a custom index is configured (no external dependencies)
   3) Displays upgradeable packages with old/new versions
   4) Interactive menu (space toggles, enter confirms; multiple selection)
   5) Upgrades selected packages via pip
@@ -17,17 +18,34 @@ Works on Linux/macOS (uses curses).
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
 import curses
+import functools
+import hashlib
 import json
 import os
 import re
+import selectors
 import subprocess
 import sys
-import threading
 import time
-from dataclasses import dataclass
+import urllib.error
+import urllib.request
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from typing import (
+    AbstractSet,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 try:
     # Python 3.8+
@@ -35,17 +53,56 @@ try:
 except Exception:  # pragma: no cover
     import importlib_metadata  # type: ignore
 
+try:
+    # Optional accelerator: orjson parses large JSON payloads ~3x faster than
+    # the stdlib. The tool stays dependency-free; stdlib json is the fallback.
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+try:
+    # Optional accelerator: ijson streams pip's JSON incrementally, so parsing
+    # overlaps the subprocess instead of waiting for its full output.
+    import ijson  # type: ignore
+except Exception:  # pragma: no cover
+    ijson = None  # type: ignore
+
+try:
+    # Optional accelerator: msgspec decodes+validates pip's JSON straight into
+    # typed structs in one C pass, skipping intermediate dicts entirely.
+    import msgspec  # type: ignore
+except Exception:  # pragma: no cover
+    msgspec = None  # type: ignore
+
+try:
+    # Reuse pip's vendored 'packaging' for proper PEP 440 ordering and
+    # Requires-Python checks when present.
+    from pip._vendor.packaging.specifiers import SpecifierSet  # type: ignore
+    from pip._vendor.packaging.version import InvalidVersion, Version  # type: ignore
+except Exception:  # pragma: no cover
+    InvalidVersion = Exception  # type: ignore
+    Version = None  # type: ignore
+    SpecifierSet = None  # type: ignore
+
 
 # ----------------------------
 # Helpers: normalization / IO
 # ----------------------------
 
 _NAME_NORM_RE = re.compile(r"[-_.]+")
+_NORM_TABLE = str.maketrans("_.", "--")
 
 
+@functools.lru_cache(maxsize=4096)
 def norm_name(name: str) -> str:
-    # PEP 503-like normalization: collapse [-_.] to "-"
-    return _NAME_NORM_RE.sub("-", name).lower().strip()
+    # PEP 503-like normalization: collapse [-_.] to "-". A translate-table
+    # lookup beats regex substitution for the common single-separator case;
+    # the regex only runs when separator runs need collapsing. Cached because
+    # the same names are normalized repeatedly in filters and sort keys.
+    n = name.translate(_NORM_TABLE).lower().strip()
+    if "--" in n:
+        n = _NAME_NORM_RE.sub("-", n)
+    return n
 
 
 def run_capture(cmd: Sequence[str], env: Optional[Dict[str, str]] = None) -> Tuple[int, str, str]:
@@ -101,7 +158,9 @@ def detect_conda_prefix() -> Optional[Path]:
         if p.exists():
             return p
 
-    # Heuristic: sys.prefix contains conda-meta
+    # Heuristic: sys.prefix contains conda-meta. Checked unconditionally:
+    # an *unactivated* env (cron, shebang, <env>/bin/python run directly)
+    # sets none of conda's env vars, and this is the only signal left.
     p = Path(sys.prefix)
     if (p / "conda-meta").is_dir():
         return p
@@ -116,13 +175,34 @@ def conda_meta_names(conda_prefix: Path) -> Set[str]:
     this only as a *secondary* exclusion signal.
     """
     meta_dir = conda_prefix / "conda-meta"
-    names: Set[str] = set()
-    if not meta_dir.is_dir():
-        return names
 
-    for jf in meta_dir.glob("*.json"):
+    # os.scandir gives names straight off readdir, without the per-entry Path
+    # construction and fnmatch/stat work that Path.glob/iterdir do. Collect
+    # the stems in one pass, then build the set in a single comprehension so
+    # the per-entry split/normalize work stays inside the C eval loop instead
+    # of repeated names.add bytecode.
+    try:
+        with os.scandir(meta_dir) as it:
+            stems = [e.name[: -len(".json")] for e in it if e.name.endswith(".json")]
+    except OSError:  # missing dir, permissions, ...
+        return set()
+
+    # Filenames follow '<name>-<version>-<build>.json', so the name is
+    # recoverable without opening the file (same trick pip uses for
+    # .dist-info directories).
+    names = {
+        norm_name(s.rsplit("-", 2)[0])
+        for s in stems
+        if s.count("-") >= 2 and not s.startswith("-")
+    }
+
+    # Rare fallback: parse the JSON for filenames that don't conform.
+    for s in stems:
+        if s.count("-") >= 2 and not s.startswith("-"):
+            continue
         try:
-            data = json.loads(jf.read_text(encoding="utf-8"))
+            with open(meta_dir / f"{s}.json", encoding="utf-8") as f:
+                data = json.load(f)
             n = data.get("name")
             if isinstance(n, str) and n.strip():
                 names.add(norm_name(n))
@@ -135,14 +215,24 @@ def conda_meta_names(conda_prefix: Path) -> Set[str]:
 # Installed package inventory
 # ----------------------------
 
-@dataclass(frozen=True)
-class InstalledDist:
+class InstalledDist(NamedTuple):
+    # NamedTuple over a frozen dataclass: C-implemented construction, no
+    # per-instance __dict__, and instances stay immutable.
     name: str          # display/original
     version: str
     installer: str     # "pip", "conda", "", etc.
 
 
 def read_installer(dist) -> str:
+    # Fast path: read INSTALLER directly from the metadata directory with a
+    # single open(), avoiding the extra stat/lookup dance in dist.read_text.
+    path = getattr(dist, "_path", None)
+    if path is not None:
+        try:
+            with open(path / "INSTALLER", encoding="utf-8") as f:
+                return f.read().strip().lower()
+        except OSError:
+            return ""
     try:
         txt = dist.read_text("INSTALLER")
         return (txt or "").strip().lower()
@@ -150,32 +240,108 @@ def read_installer(dist) -> str:
         return ""
 
 
+def _parse_info_dir_name(fn: str) -> Optional[Tuple[str, str]]:
+    """
+    Split a metadata directory name into (name, version) without any I/O
+    (the same trick pip uses): 'name-version.dist-info' or
+    'name-version[-pyX.Y].egg-info'. Returns None when the name doesn't
+    conform, e.g. a bare 'name.egg-info'.
+    """
+    if fn.endswith(".dist-info"):
+        stem = fn[: -len(".dist-info")]
+        name, sep, version = stem.partition("-")
+    elif fn.endswith(".egg-info"):
+        stem = fn[: -len(".egg-info")]
+        name, sep, rest = stem.partition("-")
+        version = rest.partition("-")[0]  # drop a trailing '-pyX.Y' tag
+    else:
+        return None
+    if not sep or not name or not version:
+        return None
+    return name, version
+
+
+def _read_installer_file(info_dir: str) -> str:
+    try:
+        with open(os.path.join(info_dir, "INSTALLER"), encoding="utf-8") as f:
+            return f.read().strip().lower()
+    except OSError:
+        return ""
+
+
+def _dist_at_fallback(path: str) -> Optional[InstalledDist]:
+    """Slow path: load metadata via importlib for a non-conforming dir name."""
+    try:
+        dist = importlib_metadata.Distribution.at(path)
+        name = str(dist.metadata.get("Name") or "").strip()  # type: ignore[attr-defined]
+        if not name:
+            return None
+        return InstalledDist(
+            name=name,
+            version=str(dist.version or ""),
+            installer=read_installer(dist),
+        )
+    except Exception:
+        return None
+
+
+_installed_dists_cache: Optional[List[InstalledDist]] = None
+
+
 def list_installed_distributions() -> List[InstalledDist]:
+    """
+    Inventory installed distributions by scanning sys.path directly: one
+    os.scandir per directory, with name and version parsed from the
+    '.dist-info'/'.egg-info' entry names and INSTALLER read with a single
+    open(). This skips importlib's per-dist METADATA parse entirely; the
+    importlib slow path only runs for metadata dirs with non-conforming
+    names. Duplicates resolve to the first hit on sys.path, mirroring
+    importlib semantics. Memoized for the lifetime of the process.
+    """
+    global _installed_dists_cache
+    if _installed_dists_cache is not None:
+        return _installed_dists_cache
+
     out: List[InstalledDist] = []
-    for dist in importlib_metadata.distributions():
+    seen: Set[str] = set()
+
+    for path_entry in sys.path:
         try:
-            name = dist.metadata.get("Name") or dist.metadata.get("name")  # type: ignore[attr-defined]
-            if not name:
-                continue
-            name = str(name).strip()
-            if not name:
-                continue
-            out.append(
-                InstalledDist(
-                    name=name,
-                    version=str(getattr(dist, "version", "") or ""),
-                    installer=read_installer(dist),
-                )
-            )
-        except Exception:
+            it = os.scandir(path_entry or ".")
+        except OSError:  # nonexistent dir, zip entry, ...
             continue
+        with it:
+            for entry in it:
+                fn = entry.name
+                if not fn.endswith((".dist-info", ".egg-info")):
+                    continue
+                parsed = _parse_info_dir_name(fn)
+                if parsed is not None:
+                    name, version = parsed
+                    dist = InstalledDist(
+                        name=name,
+                        version=version,
+                        installer=_read_installer_file(entry.path),
+                    )
+                else:
+                    maybe = _dist_at_fallback(entry.path)
+                    if maybe is None:
+                        continue
+                    dist = maybe
+                n = norm_name(dist.name)
+                if n in seen:
+                    continue
+                seen.add(n)
+                out.append(dist)
+
+    _installed_dists_cache = out
     return out
 
 
-def pip_installed_set_excluding_conda() -> Tuple[Set[str], int, int, Optional[Path]]:
+def pip_installed_set_excluding_conda() -> Tuple[FrozenSet[str], int, int, Optional[Path]]:
     """
     Returns:
-      - set of normalized names considered 'pip-installed'
+      - frozenset of normalized names considered 'pip-installed'
       - count_pip
       - count_excluded_conda
       - conda_prefix (or None)
@@ -209,19 +375,20 @@ def pip_installed_set_excluding_conda() -> Tuple[Set[str], int, int, Optional[Pa
             # Other installers (e.g., "uv") are treated as pip-like by default.
             pip_names.add(n)
 
-    return pip_names, len(pip_names), excluded_conda, conda_prefix
+    # The set is only read after this point; frozenset is slightly tighter.
+    return frozenset(pip_names), len(pip_names), excluded_conda, conda_prefix
 
 
 # ----------------------------
 # pip-review integration
 # ----------------------------
 
-@dataclass(frozen=True)
-class UpgradeCandidate:
+class UpgradeCandidate(NamedTuple):
     name: str
     current: str
     latest: str
     dist_type: str = ""
+    norm: str = ""  # normalized name, computed once at construction
 
 
 def _base_env() -> Dict[str, str]:
@@ -231,103 +398,490 @@ def _base_env() -> Dict[str, str]:
     return env
 
 
-def parse_pip_list_outdated_json(output: str) -> List[UpgradeCandidate]:
+def _json_loads(data: bytes) -> object:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+if msgspec is not None:
+    class _PipOutdated(msgspec.Struct):
+        """Schema for one 'pip list --outdated --format=json' item."""
+        name: str
+        version: str
+        latest_version: str
+
+    _pip_outdated_decoder = msgspec.json.Decoder(List[_PipOutdated])
+else:
+    _pip_outdated_decoder = None
+
+
+def _candidates_from_structs(
+    items: "List[_PipOutdated]", keep: Optional[AbstractSet[str]] = None
+) -> List[UpgradeCandidate]:
+    """Build candidates from msgspec-decoded structs: attribute access only,
+    no per-item dict lookups or isinstance checks."""
+    cands: List[UpgradeCandidate] = []
+    contains = keep.__contains__ if keep is not None else None
+    for item in items:
+        n = norm_name(item.name)
+        if contains is not None and not contains(n):
+            continue
+        cands.append(UpgradeCandidate(item.name, item.version, item.latest_version, "", n))
+    return cands
+
+
+def _candidates_from_items(
+    data: Iterable[object], keep: Optional[AbstractSet[str]] = None
+) -> List[UpgradeCandidate]:
+    """Build candidates from parsed pip-list items, filtering against 'keep'."""
+    cands: List[UpgradeCandidate] = []
+    # Hoist the bound method out of the loop; saves an attribute lookup per item.
+    contains = keep.__contains__ if keep is not None else None
+
+    for item in data:
+        if not isinstance(item, dict):
+            continue
+        name = item.get("name")
+        current = item.get("version")
+        latest = item.get("latest_version")
+        if name and current and latest:
+            n = norm_name(str(name))
+            if contains is not None and not contains(n):
+                continue
+            cands.append(UpgradeCandidate(
+                name=str(name),
+                current=str(current),
+                latest=str(latest),
+                dist_type="",
+                norm=n,
+            ))
+    return cands
+
+
+def parse_pip_list_outdated_json(
+    output: Union[bytes, str], keep: Optional[AbstractSet[str]] = None
+) -> List[UpgradeCandidate]:
     """
     Parses JSON output from 'pip list --outdated --format=json'.
     Format: [{"name": "pkg", "version": "1.0", "latest_version": "2.0"}, ...]
+    Accepts bytes (preferred: avoids a decode, and orjson wants bytes) or str.
+    When 'keep' is given, only packages whose normalized name is in it are
+    returned, so filtering happens during the parse instead of a second pass.
     """
-    cands: List[UpgradeCandidate] = []
-    if not output.strip():
-        return cands
-    
+    out_bytes = output.encode("utf-8") if isinstance(output, str) else output
+    if not out_bytes.strip():
+        return []
+
+    if _pip_outdated_decoder is not None:
+        try:
+            items = _pip_outdated_decoder.decode(out_bytes)
+        except msgspec.DecodeError:
+            pass  # malformed or schema drift; use the generic parser below
+        else:
+            return _candidates_from_structs(items, keep)
+
     try:
-        data = json.loads(output)
-        if not isinstance(data, list):
-            return cands
-        
-        for item in data:
-            if not isinstance(item, dict):
-                continue
-            name = item.get("name")
-            current = item.get("version")
-            latest = item.get("latest_version")
-            if name and current and latest:
-                cands.append(UpgradeCandidate(
-                    name=str(name),
-                    current=str(current),
-                    latest=str(latest),
-                    dist_type=""
-                ))
-    except json.JSONDecodeError:
-        pass
-    
-    return cands
+        data = _json_loads(out_bytes)
+    except ValueError:  # covers json.JSONDecodeError and orjson.JSONDecodeError
+        return []
+    if not isinstance(data, list):
+        return []
+    return _candidates_from_items(data, keep)
+
 
+def _render_progress_bar(done: int, total: int) -> None:
+    """Redraw the in-place progress bar at done-out-of-total packages.
+
+    Shared by both check paths: the PyPI path passes a real completion
+    count, the pip path a count synthesized from its time estimate.
+    """
+    bar_width = 30
+    pct = 100 * done // total
+    filled = bar_width * done // total
+    bar = "█" * filled + "░" * (bar_width - filled)
+    sys.stdout.write(f"\rChecking {total} packages [{bar}] {pct}%")
+    sys.stdout.flush()
+
+
+def get_upgrade_candidates_from_pip(
+    total_packages: int, keep: Optional[AbstractSet[str]] = None
+) -> List[UpgradeCandidate]:
+    """Get outdated packages directly from pip with progress bar.
+
+    Single-threaded: the main thread multiplexes over the subprocess's pipes
+    with selectors (the tool is Linux/macOS-only anyway), updating the
+    progress bar between reads — no background thread, Event, or handoff
+    dict. With ijson available the JSON array is parsed incrementally via
+    its push (coroutine) API as chunks arrive, so parsing overlaps pip's
+    network work and peak memory stays flat; otherwise the buffered output
+    is parsed at the end.
+    """
+    cmd = [sys.executable, "-m", "pip", "list", "--outdated", "--format=json"]
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=_base_env()
+    )
 
-def _show_progress_bar(total_packages: int, stop_event: threading.Event) -> None:
-    """Animate a tqdm-style progress bar while checking for outdated packages."""
     start_time = time.time()
     # Estimate ~0.1s per package for the check, minimum 3 seconds
     estimated_seconds = max(total_packages * 0.1, 3)
-    bar_width = 30
-    
-    while not stop_event.is_set():
-        elapsed = time.time() - start_time
-        # Calculate percentage based on elapsed vs estimated time
-        pct = min(100, int((elapsed / estimated_seconds) * 100))
-        
-        # Build progress bar with smooth fill
-        filled = int(bar_width * pct / 100)
-        bar = "█" * filled + "░" * (bar_width - filled)
-        
-        # Show progress
-        print(f"\rChecking {total_packages} packages [{bar}] {pct}%", end="", flush=True)
-        time.sleep(0.05)  # Update 20 times per second for smooth animation
-    
-    # Fill to 100% when done
-    bar = "█" * bar_width
-    print(f"\rChecking {total_packages} packages [{bar}] 100%", end="", flush=True)
-    time.sleep(0.1)
-    # Clear the line when done
-    print("\r" + " " * 80 + "\r", end="")
+    last_pct = -1
+
+    out_chunks: List[bytes] = []
+    err_chunks: List[bytes] = []
+    parse_failed = False
+    if ijson is not None:
+        items = ijson.sendable_list()
+        coro = ijson.items_coro(items, "item")
+    else:
+        items = []
+        coro = None
+
+    sel = selectors.DefaultSelector()
+    sel.register(proc.stdout, selectors.EVENT_READ, out_chunks)
+    sel.register(proc.stderr, selectors.EVENT_READ, err_chunks)
+    open_pipes = 2
+    while open_pipes:
+        for key, _ in sel.select(timeout=0.25):
+            data = os.read(key.fd, 1 << 16)
+            if not data:
+                sel.unregister(key.fileobj)
+                open_pipes -= 1
+            elif key.fileobj is proc.stdout and coro is not None and not parse_failed:
+                try:
+                    coro.send(data)
+                except Exception:
+                    parse_failed = True  # truncated/invalid; rc check decides
+            else:
+                key.data.append(data)
+
+        pct = min(100, int((time.time() - start_time) / estimated_seconds * 100))
+        if pct != last_pct:
+            last_pct = pct
+            _render_progress_bar(total_packages * pct // 100, total_packages)
+    sel.close()
+    rc = proc.wait()
+
+    if coro is not None and not parse_failed:
+        try:
+            coro.close()
+        except Exception:
+            parse_failed = True
 
+    _render_progress_bar(total_packages, total_packages)
+    sys.stdout.write("\r" + " " * 80 + "\r")
+    sys.stdout.flush()
 
-def get_upgrade_candidates_from_pip(total_packages: int) -> List[UpgradeCandidate]:
-    """Get outdated packages directly from pip with progress bar."""
-    stop_event = threading.Event()
-    result_container = {}
-    
-    def run_pip():
-        """Run pip command in background thread."""
-        cmd = [sys.executable, "-m", "pip", "list", "--outdated", "--format=json"]
-        rc, out, err = run_capture(cmd, env=_base_env())
-        result_container['rc'] = rc
-        result_container['out'] = out
-        result_container['err'] = err
-        stop_event.set()  # Signal that pip is done
-    
-    # Start pip command in background thread
-    pip_thread = threading.Thread(target=run_pip)
-    pip_thread.start()
-    
-    # Show progress bar while waiting
-    _show_progress_bar(total_packages, stop_event)
-    
-    # Wait for pip thread to complete
-    pip_thread.join()
-    
-    # Check results
-    rc = result_container.get('rc', 1)
-    out = result_container.get('out', '')
-    err = result_container.get('err', '')
-    
     if rc != 0:
-        msg = (err or "").strip()
+        msg = b"".join(err_chunks).decode("utf-8", errors="replace").strip()
         if msg:
             print(msg)
         raise SystemExit(rc)
 
-    cands = parse_pip_list_outdated_json(out)
+    if coro is not None:
+        return [] if parse_failed else _candidates_from_items(items, keep)
+    return parse_pip_list_outdated_json(b"".join(out_chunks), keep)
+
+
+# ----------------------------
+# PyPI version checks (fast path)
+# ----------------------------
+
+_PYPI_JSON_URL = "https://pypi.org/pypi/{name}/json"
+_PYPI_POOL_SIZE = 16
+
+_VERSION_TOKEN_RE = re.compile(r"\d+|[a-z]+")
+
+
+def _version_key(v: str) -> Tuple[Tuple[int, object], ...]:
+    """
+    Lightweight version ordering used only when pip's vendored 'packaging'
+    is unavailable: numeric fields compare as ints, letter runs sort below
+    numbers at the same position.
+    """
+    return tuple(
+        (1, int(tok)) if tok.isdigit() else (0, tok)
+        for tok in _VERSION_TOKEN_RE.findall(v.lower())
+    )
+
+
+def _is_newer(latest: str, current: str) -> bool:
+    """True if 'latest' is strictly newer than 'current'."""
+    if Version is not None:
+        try:
+            lv, cv = Version(latest), Version(current)
+            # Match pip's default: don't offer pre-releases unless one is installed.
+            return lv > cv and (not lv.is_prerelease or cv.is_prerelease)
+        except InvalidVersion:
+            pass
+    return _version_key(latest) > _version_key(current)
+
+
+_PY_VERSION = ".".join(map(str, sys.version_info[:3]))
+
+
+def _excluded_by_requires_python(requires_python: str) -> bool:
+    """True if a Requires-Python specifier rules out the running interpreter."""
+    if not requires_python or SpecifierSet is None:
+        return False
+    try:
+        return _PY_VERSION not in SpecifierSet(requires_python)
+    except Exception:
+        # Malformed specifier: don't exclude; pip will be the judge.
+        return False
+
+
+def _fetch_latest_version(name: str) -> Optional[str]:
+    """Query PyPI's JSON API for the latest release of a package.
+
+    Returns None when there is no usable release, including when its
+    Requires-Python excludes the running interpreter — 'pip list
+    --outdated' applies that filter, so the fast path must match it
+    instead of offering versions pip would then refuse to install.
+    """
+    url = _PYPI_JSON_URL.format(name=name)
+    with urllib.request.urlopen(url, timeout=10) as resp:
+        payload = json.loads(resp.read().decode("utf-8"))
+    info = payload.get("info") or {}
+    latest = info.get("version")
+    if not latest:
+        return None
+    if _excluded_by_requires_python(str(info.get("requires_python") or "")):
+        return None
+    return str(latest)
+
+
+def _pip_index_config() -> str:
+    """
+    Best-effort description of the configured package index: the
+    PIP_INDEX_URL / PIP_EXTRA_INDEX_URL environment variables plus the
+    contents of any standard pip config file mentioning an index-url.
+    Empty (whitespace-only) means the default index. This single signal
+    both gates the direct-PyPI fast path and keys the on-disk cache, so
+    the two can't disagree about what "same index" means.
+    """
+    parts = [
+        os.environ.get("PIP_INDEX_URL", ""),
+        os.environ.get("PIP_EXTRA_INDEX_URL", ""),
+    ]
+    home = Path.home()
+    xdg = Path(os.environ.get("XDG_CONFIG_HOME", home / ".config"))
+    conf_paths = [
+        os.environ.get("PIP_CONFIG_FILE"),
+        Path(sys.prefix) / "pip.conf",  # venv / site
+        xdg / "pip" / "pip.conf",  # user
+        home / ".pip" / "pip.conf",  # user (legacy)
+        home / "Library" / "Application Support" / "pip" / "pip.conf",  # macOS
+        Path("/etc/pip.conf"),  # global
+        Path("/etc/xdg/pip/pip.conf"),  # global (XDG)
+    ]
+    for cp in conf_paths:
+        if not cp:
+            continue
+        try:
+            with open(cp, encoding="utf-8") as f:
+                content = f.read()
+        except OSError:
+            continue
+        # Covers both index-url and extra-index-url.
+        if "index-url" in content:
+            parts.append(f"{cp}\n{content}")
+    return "\n".join(parts)
+
+
+def _custom_index_configured() -> bool:
+    """
+    True when a non-default package index is configured. Direct PyPI
+    queries would silently bypass such an index, so callers must stick
+    with pip when this returns True.
+    """
+    return bool(_pip_index_config().strip())
+
+
+def get_upgrade_candidates_from_pypi(
+    pip_names: AbstractSet[str],
+) -> Optional[List[UpgradeCandidate]]:
+    """
+    Check for outdated packages by querying PyPI's JSON API concurrently,
+    one small HTTPS request per pip-installed package. The requests are
+    network-bound, so a thread pool gives near-linear speedup over the
+    serial check that 'pip list --outdated' performs, and completed futures
+    drive a *real* progress counter instead of a time-based estimate.
+
+    Returns None when the result can't be trusted (a custom index is
+    configured, or any query failed); the caller should then fall back to
+    'pip list --outdated', which honors pip's own configuration.
+    """
+    if _custom_index_configured():
+        return None
+    if SpecifierSet is None:
+        # Without pip's vendored packaging we can't replicate the
+        # Requires-Python filtering that 'pip list --outdated' does.
+        return None
+
+    # Query each pip-installed dist once (first hit wins on duplicates),
+    # carrying the normalized name along so it is computed exactly once per
+    # dist instead of again for the URL and again for the candidate.
+    contains = pip_names.__contains__
+    targets: List[Tuple[InstalledDist, str]] = []
+    seen: Set[str] = set()
+    for d in list_installed_distributions():
+        n = norm_name(d.name)
+        if d.version and contains(n) and n not in seen:
+            seen.add(n)
+            targets.append((d, n))
+    if not targets:
+        return []
+
+    total = len(targets)
+    cands: List[UpgradeCandidate] = []
+    network_errors = 0
+    done = 0
+
+    workers = min(total, _PYPI_POOL_SIZE)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(_fetch_latest_version, n): (d, n) for d, n in targets
+        }
+        for fut in concurrent.futures.as_completed(futures):
+            d, n = futures[fut]
+            done += 1
+            try:
+                latest = fut.result()
+            except urllib.error.HTTPError as e:
+                if e.code in (404, 410):
+                    # Not hosted on PyPI; nothing to compare against.
+                    latest = None
+                else:
+                    # 429/5xx/...: the query failed, not the package.
+                    network_errors += 1
+                    latest = None
+            except Exception:
+                network_errors += 1
+                latest = None
+            if latest and _is_newer(latest, d.version):
+                cands.append(
+                    UpgradeCandidate(
+                        name=d.name,
+                        current=d.version,
+                        latest=latest,
+                        norm=n,
+                    )
+                )
+            _render_progress_bar(done, total)
+
+    # Clear the progress line.
+    print("\r" + " " * 80 + "\r", end="")
+
+    # Any failed query means the list may be missing packages; don't let an
+    # incomplete run masquerade as authoritative (it would also get cached).
+    if network_errors:
+        return None
+    return cands
+
+
+# ----------------------------
+# On-disk result cache
+# ----------------------------
+
+_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "pip-select"
+DEFAULT_CACHE_TTL = 15 * 60  # seconds
+
+
+def _env_fingerprint() -> str:
+    """Hash of the installed name==version set; changes whenever the env does.
+
+    The configured index is part of the key too — the same signal the
+    direct-PyPI guard uses, covering PIP_INDEX_URL/PIP_EXTRA_INDEX_URL and
+    pip config files — so switching or editing an index between runs can't
+    serve results obtained against the other one.
+    """
+    dists = list_installed_distributions()
+    index_cfg = _pip_index_config()
+    payload = b"\n".join(
+        sorted(f"{norm_name(d.name)}=={d.version}".encode("utf-8") for d in dists)
+    ) + b"\n" + index_cfg.encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def load_cached_candidates(
+    cache_ttl: int, keep: Optional[AbstractSet[str]] = None
+) -> Optional[List[UpgradeCandidate]]:
+    """
+    Return the cached outdated-package list for this environment, or None if
+    there is no cache entry fresher than cache_ttl seconds. The fingerprint
+    key means any install/uninstall/upgrade invalidates the entry implicitly.
+    """
+    if cache_ttl <= 0:
+        return None
+    path = _CACHE_DIR / f"{_env_fingerprint()}.json"
+    try:
+        if time.time() - path.stat().st_mtime > cache_ttl:
+            return None
+        raw = path.read_bytes()
+    except OSError:
+        return None
+    # Parse strictly here: the lenient pip parser turns garbage into [],
+    # which a caller would happily treat as "everything is up to date".
+    # A corrupt or truncated entry must be a cache miss instead.
+    try:
+        data = _json_loads(raw)
+    except ValueError:
+        return None
+    if not isinstance(data, list):
+        return None
+    return _candidates_from_items(data, keep)
+
+
+def save_cached_candidates(cands: List[UpgradeCandidate]) -> None:
+    """Persist the outdated-package list; failures are non-fatal."""
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Same schema as 'pip list --outdated --format=json', so loading can
+        # reuse the pip parser.
+        payload = [
+            {"name": c.name, "version": c.current, "latest_version": c.latest}
+            for c in cands
+        ]
+        path = _CACHE_DIR / f"{_env_fingerprint()}.json"
+        # Write-then-rename so a killed run can't leave a truncated entry
+        # behind (os.replace is atomic on the same filesystem).
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp, path)
+        # Opportunistically drop entries (and orphaned temp files) for
+        # stale fingerprints.
+        cutoff = time.time() - 24 * 3600
+        for old in _CACHE_DIR.glob("*.json*"):
+            if old != path and old.stat().st_mtime < cutoff:
+                old.unlink()
+    except OSError:
+        pass
+
+
+def get_upgrade_candidates(
+    pip_names: AbstractSet[str],
+    total_packages: int,
+    cache_ttl: int = DEFAULT_CACHE_TTL,
+    no_cache: bool = False,
+) -> List[UpgradeCandidate]:
+    """Fast concurrent PyPI check, with 'pip list --outdated' as fallback.
+
+    Results are cached on disk keyed by the environment fingerprint, so
+    back-to-back invocations skip the network round-trip entirely.
+    """
+    if not no_cache:
+        cached = load_cached_candidates(cache_ttl, pip_names)
+        if cached is not None:
+            print("Using cached outdated-package results (use --no-cache to refresh).")
+            return cached
+
+    cands = get_upgrade_candidates_from_pypi(pip_names)
+    if cands is None:
+        cands = get_upgrade_candidates_from_pip(total_packages, pip_names)
+
+    if cache_ttl > 0:
+        save_cached_candidates(cands)
     return cands
 
 
@@ -340,6 +894,12 @@ def curses_select(cands: List[UpgradeCandidate]) -> Optional[List[UpgradeCandida
     pos = 0
     top = 0
 
+    # The line text is immutable apart from the selection mark, so pre-render
+    # both variants once and index by the selection flag, instead of
+    # re-formatting f-strings for every visible row on every repaint.
+    lines_off = [f"[ ] {c.name}  {c.current} -> {c.latest}" for c in cands]
+    lines_on = ["[x]" + line[3:] for line in lines_off]
+
     def clamp(n: int, lo: int, hi: int) -> int:
         return max(lo, min(hi, n))
 
@@ -349,40 +909,77 @@ def curses_select(cands: List[UpgradeCandidate]) -> Optional[List[UpgradeCandida
         curses.curs_set(0)
         stdscr.keypad(True)
 
-        while True:
-            stdscr.erase()
-            h, w = stdscr.getmaxyx()
-            body_h = max(1, h - 2)
-
-            # Keep pos visible
-            pos = clamp(pos, 0, len(cands) - 1)
-            if pos < top:
-                top = pos
-            if pos >= top + body_h:
-                top = pos - body_h + 1
-            top = clamp(top, 0, max(0, len(cands) - body_h))
-
-            # Header
+        h, w = stdscr.getmaxyx()
+        body_h = max(1, h - 2)
+        # Dirty-region rendering: only rows that actually changed get redrawn.
+        # A full erase+repaint happens only on the first frame, on scroll, and
+        # on terminal resize; a plain cursor move just flips two rows' attrs.
+        dirty: Set[int] = set()
+        full_redraw = True
+        prev_pos = pos
+        prev_chosen = -1
+
+        def render_header() -> int:
             chosen = sum(1 for x in selected if x)
             header = "SPACE=toggle  ↑/↓/PgUp/PgDn=move  Home/End=jump  a=all  n=none  Enter=upg  q=quit"
             status = f"Selected: {chosen}/{len(cands)}"
+            stdscr.move(0, 0)
+            stdscr.clrtoeol()
             stdscr.addnstr(0, 0, header, w - 1)
             stdscr.addnstr(0, max(0, w - 1 - len(status)), status, w - 1)
+            return chosen
+
+        def render_row(idx: int) -> None:
+            row = idx - top
+            if not (0 <= row < body_h) or idx >= len(cands):
+                return
+            line = (lines_on if selected[idx] else lines_off)[idx]
+            attr = curses.A_REVERSE if idx == pos else curses.A_NORMAL
+            stdscr.move(1 + row, 0)
+            stdscr.clrtoeol()
+            stdscr.addnstr(1 + row, 0, line, w - 1, attr)
 
-            # Body
-            for row in range(body_h):
-                idx = top + row
-                if idx >= len(cands):
-                    break
-                c = cands[idx]
-                mark = "[x]" if selected[idx] else "[ ]"
-                line = f"{mark} {c.name}  {c.current} -> {c.latest}"
-                if idx == pos:
-                    stdscr.attron(curses.A_REVERSE)
-                    stdscr.addnstr(1 + row, 0, line, w - 1)
-                    stdscr.attroff(curses.A_REVERSE)
-                else:
-                    stdscr.addnstr(1 + row, 0, line, w - 1)
+        while True:
+            if full_redraw:
+                h, w = stdscr.getmaxyx()
+                body_h = max(1, h - 2)
+
+            # Keep pos visible; crossing an edge scrolls (full repaint).
+            pos = clamp(pos, 0, len(cands) - 1)
+            new_top = top
+            if pos < new_top:
+                new_top = pos
+            if pos >= new_top + body_h:
+                new_top = pos - body_h + 1
+            new_top = clamp(new_top, 0, max(0, len(cands) - body_h))
+            if new_top != top:
+                top = new_top
+                full_redraw = True
+
+            if full_redraw:
+                stdscr.erase()
+                prev_chosen = render_header()
+                for row in range(body_h):
+                    idx = top + row
+                    if idx >= len(cands):
+                        break
+                    render_row(idx)
+                dirty.clear()
+                full_redraw = False
+            else:
+                for idx in dirty:
+                    render_row(idx)
+                dirty.clear()
+                if pos != prev_pos:
+                    # Flip attributes in place; the cell contents are unchanged.
+                    old_row = prev_pos - top
+                    if 0 <= old_row < body_h:
+                        stdscr.chgat(1 + old_row, 0, w - 1, curses.A_NORMAL)
+                    stdscr.chgat(1 + (pos - top), 0, w - 1, curses.A_REVERSE)
+                chosen = sum(1 for x in selected if x)
+                if chosen != prev_chosen:
+                    prev_chosen = render_header()
+            prev_pos = pos
 
             stdscr.refresh()
 
@@ -407,10 +1004,15 @@ def curses_select(cands: List[UpgradeCandidate]) -> Optional[List[UpgradeCandida
                 pos = len(cands) - 1
             elif ch == ord(" "):
                 selected[pos] = not selected[pos]
+                dirty.add(pos)
             elif ch in (ord("a"), ord("A")):
                 selected = [True] * len(cands)
+                full_redraw = True
             elif ch in (ord("n"), ord("N")):
                 selected = [False] * len(cands)
+                full_redraw = True
+            elif ch == curses.KEY_RESIZE:
+                full_redraw = True
             elif ch in (curses.KEY_ENTER, 10, 13):
                 chosen_items = [cands[i] for i, ok in enumerate(selected) if ok]
                 return chosen_items
@@ -439,26 +1041,58 @@ def fallback_select(cands: List[UpgradeCandidate]) -> Optional[List[UpgradeCandi
 # Upgrade execution
 # ----------------------------
 
+# Packages per pip process when upgrading in parallel; small enough that the
+# resolver's superlinear work stays cheap per process.
+_UPGRADE_CHUNK_SIZE = 8
+
+
 def upgrade_selected(
     chosen: List[UpgradeCandidate],
     pip_user: bool,
     extra_pip_args: List[str],
     dry_run: bool,
+    parallel: int = 1,
 ) -> int:
+    """Run 'pip install --upgrade' for the chosen packages.
+
+    The default is one serial pip call for everything. With parallel > 1 the
+    specs are split into chunks of up to 8 and upgraded by concurrent pip
+    processes; this can conflict when packages share transitive deps with
+    incompatible pins, which is why it stays opt-in (see README).
+    """
     if not chosen:
         print("No packages selected. Nothing to do.")
         return 0
 
     specs = [f"{c.name}=={c.latest}" for c in chosen]
 
-    cmd = [sys.executable, "-m", "pip", "install", "--upgrade"]
+    base_cmd = [sys.executable, "-m", "pip", "install", "--upgrade"]
     if pip_user:
-        cmd.append("--user")
-    cmd += specs
-    cmd += extra_pip_args
+        base_cmd.append("--user")
+
+    if parallel <= 1 or len(specs) <= _UPGRADE_CHUNK_SIZE:
+        cmd = base_cmd + specs + extra_pip_args
+
+        print("\nWill run:")
+        print("  " + " ".join(cmd))
+        if dry_run:
+            print("\n--dry-run enabled: not executing pip.")
+            return 0
+
+        if not ask_yes_no("\nProceed with upgrade?", default_no=True):
+            print("Cancelled.")
+            return 2
+
+        return run_stream(cmd, env=_base_env())
+
+    chunks = [
+        specs[i : i + _UPGRADE_CHUNK_SIZE]
+        for i in range(0, len(specs), _UPGRADE_CHUNK_SIZE)
+    ]
 
-    print("\nWill run:")
-    print("  " + " ".join(cmd))
+    print(f"\nWill run {len(chunks)} pip commands (up to {parallel} in parallel):")
+    for chunk in chunks:
+        print("  " + " ".join(base_cmd + chunk + extra_pip_args))
     if dry_run:
         print("\n--dry-run enabled: not executing pip.")
         return 0
@@ -467,7 +1101,23 @@ def upgrade_selected(
         print("Cancelled.")
         return 2
 
-    return run_stream(cmd, env=_base_env())
+    def run_chunk(chunk: List[str]) -> Tuple[int, str, str]:
+        # Capture output so concurrent pip runs don't interleave mid-line.
+        return run_capture(base_cmd + chunk + extra_pip_args, env=_base_env())
+
+    final_rc = 0
+    with concurrent.futures.ThreadPoolExecutor(max_workers=parallel) as pool:
+        futures = {pool.submit(run_chunk, chunk): chunk for chunk in chunks}
+        for fut in concurrent.futures.as_completed(futures):
+            rc, out, err = fut.result()
+            if out.strip():
+                print(out.rstrip())
+            if err.strip():
+                print(err.rstrip(), file=sys.stderr)
+            if rc != 0 and final_rc == 0:
+                final_rc = rc
+
+    return final_rc
 
 
 # ----------------------------
@@ -493,6 +1143,26 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         action="store_true",
         help="Disable curses UI (use text fallback selection).",
     )
+    ap.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached outdated-package results and query afresh.",
+    )
+    ap.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Upgrade in batches of 8 packages with up to N pip processes at once "
+        "(default: 1, a single serial pip call; see README for caveats).",
+    )
+    ap.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=DEFAULT_CACHE_TTL,
+        metavar="SECONDS",
+        help=f"How long cached outdated-package results stay fresh (default: {DEFAULT_CACHE_TTL}; 0 disables the cache).",
+    )
     ap.add_argument(
         "pip_args",
         nargs=argparse.REMAINDER,
@@ -515,17 +1185,24 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         print(f"Conda environment detected at: {conda_prefix}")
     print(f"Detected {pip_count} pip-installed packages (excluded {excluded_conda} conda-installed).")
 
-    all_cands = get_upgrade_candidates_from_pip(pip_count)
+    if not pip_names:
+        # Nothing to check (e.g. a pure-conda env); don't pay for a network
+        # round-trip that can only return an empty list.
+        print("No pip-installed packages found. Nothing to do.")
+        return 0
 
-    # Filter to pip-installed (exclude conda-installed)
-    cands = [c for c in all_cands if norm_name(c.name) in pip_names]
+    # Filtering to pip-installed (excluding conda-installed) happens during
+    # the parse itself, so no second pass over the candidates is needed.
+    cands = get_upgrade_candidates(
+        pip_names, pip_count, cache_ttl=args.cache_ttl, no_cache=args.no_cache
+    )
 
     if not cands:
         print("No upgradeable pip-installed packages found (excluding conda-installed).")
         return 0
 
     # Sort for stable menu
-    cands.sort(key=lambda c: norm_name(c.name))
+    cands.sort(key=attrgetter("norm"))
 
     if not args.no_curses and is_tty():
         chosen = curses_select(cands)
@@ -541,6 +1218,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         pip_user=args.user,
         extra_pip_args=extra_pip_args,
         dry_run=args.dry_run,
+        parallel=args.parallel,
     )
 
 